@@ -4,9 +4,134 @@ from OpenGL.GL import *
 from OpenGL.GLU import *
 from PIL import Image
 import numpy as np
+import bisect
+import math
 import os
 import tkinter as tk
 from tkinter import ttk
+from enum import IntEnum
+from numba import njit
+
+# Simplified blackbody color approximation: temperature thresholds (K) and
+# the RGB color for each resulting bucket (red, orange, yellow, white, blue-white)
+_TEMP_THRESHOLDS = (3500, 5000, 6000, 7500)
+_COLORS = ((1.0, 0.0, 0.0),
+           (1.0, 0.5, 0.0),
+           (1.0, 1.0, 0.0),
+           (1.0, 1.0, 1.0),
+           (0.8, 0.8, 1.0))
+
+class Stage(IntEnum):
+    """Evolutionary stages, as integers so the JIT kernel can branch on them"""
+    PROTOSTAR = 0
+    MAIN_SEQUENCE = 1
+    RED_GIANT = 2
+    WHITE_DWARF = 3
+    SUPERNOVA = 4
+
+# Display names for the text overlay, indexed by Stage
+_STAGE_NAMES = ("Protostar", "Main Sequence", "Red Giant",
+                "White Dwarf", "Supernova")
+
+@njit(cache=True, fastmath=True)
+def _step(mass, h2, age, expansion, stage_id, dt, initial_mass,
+          formation_time, ms_lifetime):
+    """Advance the star by dt and recompute its physical properties.
+
+    Numeric core of StarPhysics, kept free of Python objects so Numba can
+    compile it; stage_id follows the Stage enum values. Returns the updated
+    state as a tuple.
+    """
+    age += dt
+
+    # H2 consumption rate on the main sequence (simplified);
+    # m**3.5 written as m*m*m*sqrt(m) to avoid the pow call
+    if stage_id == 1:
+        h2 -= 0.1 * (mass * mass * mass * math.sqrt(mass)) / 1e10 * dt
+        h2 = max(0.0, h2)
+
+    # Mass loss in the red giant phase
+    if stage_id == 2:
+        mass -= 1e-11 * mass * dt
+
+    # Mass-luminosity relation (simplified)
+    if mass < 0.43:
+        luminosity = 0.23 * (mass ** 2.3)
+    elif mass < 2:
+        luminosity = mass ** 4
+    else:
+        luminosity = 1.4 * (mass * mass * mass * math.sqrt(mass))
+
+    # Temperature calculation (simplified)
+    temperature = 5778 * (luminosity ** 0.25)
+
+    # Base radius, scaled by the current expansion factor
+    if mass < 1.0:
+        base_radius = mass ** 0.8
+    else:
+        base_radius = mass ** 0.57
+    radius = base_radius * expansion
+
+    # Determine evolutionary stage
+    old_stage = stage_id
+    if age < formation_time:
+        stage_id = 0
+    elif h2 > 0.1:
+        stage_id = 1
+    elif mass > 1.44:  # Chandrasekhar limit
+        stage_id = 2 if old_stage != 4 else 4
+    elif h2 <= 0.1 and old_stage != 3:
+        stage_id = 2
+    else:
+        stage_id = 3
+
+    # Special cases during stage transitions
+    if old_stage != stage_id:
+        if old_stage == 1 and stage_id == 2:
+            # Initial expansion burst when entering red giant phase
+            expansion *= 2.0
+        elif stage_id == 4:
+            # Immediate explosive expansion
+            expansion *= 10.0
+
+    # Update the expansion factor for the (possibly new) stage
+    if stage_id == 0:
+        # Protostar starts large and contracts
+        time_factor = min(1.0, age / formation_time)
+        expansion = 2.0 - time_factor
+    elif stage_id == 1:
+        # Gradual expansion during main sequence
+        if ms_lifetime > 0:
+            progress = min(1.0, age / ms_lifetime)
+            expansion = 1.0 + (progress * 0.5)
+    elif stage_id == 2:
+        # Dramatic expansion in red giant phase
+        target_expansion = 100.0 if initial_mass > 1.44 else 50.0
+        expansion = min(target_expansion, expansion + 0.1)
+    elif stage_id == 3:
+        # Rapid contraction to white dwarf size
+        expansion = max(0.01, expansion * 0.95)
+    elif stage_id == 4:
+        # Explosive expansion
+        expansion *= 1.5
+
+    return mass, h2, age, expansion, stage_id, luminosity, temperature, radius
+
+def compute_luminosities(mass):
+    """Vectorized mass-luminosity relation for an array of stellar masses.
+
+    Mirrors the scalar branches in _step so an ensemble of stars can be
+    evolved through NumPy's C kernels instead of per-star Python calls.
+    """
+    mass = np.asarray(mass)
+    return np.select([mass < 0.43, mass < 2],
+                     [0.23 * mass ** 2.3, mass ** 4],
+                     default=1.4 * mass ** 3.5)
+
+def compute_base_radii(mass):
+    """Vectorized base-radius relation matching the scalar branches in _step"""
+    mass = np.asarray(mass)
+    return np.where(mass < 1.0, mass ** 0.8, mass ** 0.57)
 
 class StarPhysics:
     def __init__(self, initial_mass, h2_percentage):
@@ -19,154 +144,67 @@ class StarPhysics:
         self.temperature = 0
         self.radius = 0
         self.initial_radius = 0  # Store initial radius for reference
-        self.stage = "Protostar"
+        self.stage = Stage.PROTOSTAR
         self.expansion_factor = 1.0  # New variable to track expansion
-        
+
         # Constants (simplified stellar evolution parameters)
         self.SOLAR_MASS = 1.989e30  # kg
         self.SOLAR_RADIUS = 6.957e8  # meters
         self.SOLAR_LUMINOSITY = 3.828e26  # watts
-        
-        self.update_stellar_properties()
-        self.initial_radius = self.radius  # Save initial radius after first calculation
-
-    def update_stellar_properties(self):
-        """Calculate star properties based on mass and H2 content"""
-        # Mass-luminosity relation (simplified)
-        if self.current_mass < 0.43:
-            self.luminosity = 0.23 * (self.current_mass ** 2.3)
-        elif self.current_mass < 2:
-            self.luminosity = (self.current_mass ** 4)
-        else:
-            self.luminosity = 1.4 * (self.current_mass ** 3.5)
-        
-        # Temperature calculation (simplified)
-        self.temperature = 5778 * (self.luminosity ** 0.25)  # Kelvin
-        
-        # Calculate base radius
-        base_radius = self.calculate_base_radius()
-        
-        # Apply expansion factor based on stage
-        self.radius = base_radius * self.expansion_factor
-        
-        # Update evolutionary stage
-        self.determine_stage()
-        
-        # Update expansion factor based on stage
-        self.update_expansion_factor()
-    
-    def calculate_base_radius(self):
-        """Calculate the base radius before applying expansion factors"""
-        if self.current_mass < 1.0:
-            return self.current_mass ** 0.8
-        else:
-            return self.current_mass ** 0.57
-
-    def update_expansion_factor(self):
-        """Update the expansion factor based on stellar evolution stage"""
-        if self.stage == "Protostar":
-            # Protostar starts large and contracts
-            time_factor = min(1.0, self.age / self.get_formation_time())
-            self.expansion_factor = 2.0 - time_factor
-        
-        elif self.stage == "Main Sequence":
-            # Gradual expansion during main sequence
-            ms_lifetime = self.get_main_sequence_lifetime()
-            if ms_lifetime > 0:
-                progress = min(1.0, self.age / ms_lifetime)
-                self.expansion_factor = 1.0 + (progress * 0.5)
-        
-        elif self.stage == "Red Giant":
-            # Dramatic expansion in red giant phase
-            target_expansion = 100 if self.initial_mass > 1.44 else 50
-            current_expansion = self.expansion_factor
-            # Smooth transition to red giant size
-            self.expansion_factor = min(target_expansion, 
-                                     current_expansion + 0.1)
-        
-        elif self.stage == "White Dwarf":
-            # Rapid contraction to white dwarf size
-            self.expansion_factor = max(0.01, self.expansion_factor * 0.95)
-        
-        elif self.stage == "Supernova":
-            # Explosive expansion
-            self.expansion_factor *= 1.5
 
-    def determine_stage(self):
-        """Determine star's evolutionary stage based on mass and H2 content"""
-        old_stage = self.stage
-        
-        if self.age < self.get_formation_time():
-            new_stage = "Protostar"
-        elif self.current_h2 > 0.1:
-            new_stage = "Main Sequence"
-        elif self.current_mass > 1.44:  # Chandrasekhar limit
-            if old_stage != "Supernova":
-                new_stage = "Red Giant"
-            else:
-                new_stage = "Supernova"
-        elif self.current_h2 <= 0.1 and old_stage != "White Dwarf":
-            new_stage = "Red Giant"
-        else:
-            new_stage = "White Dwarf"
-        
-        # If stage has changed, handle the transition
-        if old_stage != new_stage:
-            self.handle_stage_transition(old_stage, new_stage)
-        
-        self.stage = new_stage
+        # Timescales depend only on the initial parameters; compute them once
+        self._formation_time = 50000 * (1 / initial_mass)
+        self._ms_lifetime = 1e10 * (initial_mass ** -2.5) * (h2_percentage / 71)
+        self._pending_dt = 0.0  # Time accumulated since the last full recompute
+        self._just_transitioned = False  # Force a settling step after stage changes
 
-    def handle_stage_transition(self, old_stage, new_stage):
-        """Handle special cases during stage transitions"""
-        if old_stage == "Main Sequence" and new_stage == "Red Giant":
-            # Initial expansion burst when entering red giant phase
-            self.expansion_factor *= 2.0
-        elif new_stage == "Supernova":
-            # Immediate explosive expansion
-            self.expansion_factor *= 10.0
+        self.update(0)  # Zero-length step computes the initial properties
+        self.initial_radius = self.radius  # Save initial radius after first calculation
 
     def get_formation_time(self):
-        """Calculate formation time based on mass"""
-        return 50000 * (1 / self.initial_mass)  # Simplified timescale
+        """Formation time based on mass (cached at construction)"""
+        return self._formation_time
 
     def update(self, delta_time):
         """Update star's properties over time"""
         self.age += delta_time
-        
-        # H2 consumption rate (simplified)
-        if self.stage == "Main Sequence":
-            h2_consumption_rate = 0.1 * (self.current_mass ** 3.5) / 1e10
-            self.current_h2 -= h2_consumption_rate * delta_time
-            self.current_h2 = max(0, self.current_h2)
-        
-        # Mass loss in late stages
-        if self.stage == "Red Giant":
-            mass_loss_rate = 1e-11 * self.current_mass
-            self.current_mass -= mass_loss_rate * delta_time
-        
-        self.update_stellar_properties()
+        self._pending_dt += delta_time
+
+        # On the main sequence the H2 burn is linear in time and mass is
+        # constant, so tiny steps can be batched exactly: skip the full
+        # recompute until the accumulated burn would be visible at display
+        # precision, unless the main-sequence turnoff is close or the star
+        # just changed stage (radius lags the expansion factor by one step)
+        if (self.stage == Stage.MAIN_SEQUENCE
+                and not self._just_transitioned
+                and self._pending_dt * (self.current_mass ** 3.5) / 1e10
+                    <= 1e-6 * self.current_h2
+                and self.age < 0.99 * self._ms_lifetime):
+            return
+
+        dt = self._pending_dt
+        self._pending_dt = 0.0
+        old_stage = self.stage
+        (self.current_mass, self.current_h2, self.age,
+         self.expansion_factor, stage_id, self.luminosity,
+         self.temperature, self.radius) = _step(
+            self.current_mass, self.current_h2, self.age - dt,
+            self.expansion_factor, int(old_stage), dt,
+            self.initial_mass, self._formation_time, self._ms_lifetime)
+        self._just_transitioned = stage_id != old_stage
+        self.stage = Stage(stage_id)
+
     def get_color(self):
         """Calculate star color based on temperature"""
-        # Simplified blackbody color approximation
-        temp = self.temperature
-        if temp < 3500:
-            return (1.0, 0.0, 0.0)  # Red
-        elif temp < 5000:
-            return (1.0, 0.5, 0.0)  # Orange
-        elif temp < 6000:
-            return (1.0, 1.0, 0.0)  # Yellow
-        elif temp < 7500:
-            return (1.0, 1.0, 1.0)  # White
-        else:
-            return (0.8, 0.8, 1.0)  # Blue-white
+        return _COLORS[bisect.bisect_right(_TEMP_THRESHOLDS, self.temperature)]
 
     def get_emission(self):
         """Calculate emission based on luminosity"""
-        return min(1.0, 0.2 + (np.log10(self.luminosity) / 5))
+        return min(1.0, 0.2 + (math.log10(self.luminosity) / 5))
 
     def get_main_sequence_lifetime(self):
-        """Calculate main sequence lifetime based on mass and H2 content"""
-        return 1e10 * (self.initial_mass ** -2.5) * (self.h2_percentage / 71)
+        """Main sequence lifetime based on mass and H2 content (cached)"""
+        return self._ms_lifetime
 
 def get_user_input():
     """Create GUI window for user input"""
@@ -204,75 +242,142 @@ def generate_star_texture(size=256):
     texture = np.zeros((size, size, 4), dtype=np.uint8)
     center = size // 2
     max_radius = size // 2
-    
-    for x in range(size):
-        for y in range(size):
-            dx = x - center
-            dy = y - center
-            distance = np.sqrt(dx*dx + dy*dy)
-            
-            # Base gradient
-            intensity = max(0, 1 - (distance / max_radius))
-            
-            # Surface features
-            noise = np.random.rand() * 0.2
-            pattern = (np.sin(x / 8.0) * np.cos(y / 8.0) * 0.1 + 
-                      np.sin((x + y) / 16.0) * 0.1)
-            
-            # Combine effects
-            value = min(1.0, max(0.0, intensity + noise + pattern))
-            brightness = int(value * 255)
-            alpha = int(intensity * 255)
-            
-            texture[x, y] = [brightness, brightness, brightness, alpha]
-    
+
+    # Pixel coordinate grids (broadcast instead of a per-pixel Python loop)
+    x, y = np.ogrid[:size, :size]
+    dx = x - center
+    dy = y - center
+    distance = np.sqrt(dx*dx + dy*dy)
+
+    # Base gradient
+    intensity = np.clip(1 - (distance / max_radius), 0.0, None)
+
+    # Surface features
+    rng = np.random.default_rng()
+    noise = rng.random((size, size), dtype=np.float32) * 0.2
+    pattern = (np.sin(x / 8.0) * np.cos(y / 8.0) * 0.1 +
+              np.sin((x + y) / 16.0) * 0.1)
+
+    # Combine effects
+    value = np.clip(intensity + noise + pattern, 0.0, 1.0)
+    texture[..., :3] = (value * 255).astype(np.uint8)[..., None]
+    texture[..., 3] = (intensity * 255).astype(np.uint8)
+
     return texture
 
 def load_texture():
     texture_data = generate_star_texture()
-    image_data = texture_data.tobytes()
     width = height = texture_data.shape[0]
 
     texture_id = glGenTextures(1)
     glBindTexture(GL_TEXTURE_2D, texture_id)
-    glTexImage2D(GL_TEXTURE_2D, 0, GL_RGBA, width, height, 0, GL_RGBA, GL_UNSIGNED_BYTE, image_data)
+    # PyOpenGL uploads a C-contiguous uint8 array directly; no tobytes() copy
+    glPixelStorei(GL_UNPACK_ALIGNMENT, 1)
+    glTexImage2D(GL_TEXTURE_2D, 0, GL_RGBA, width, height, 0, GL_RGBA, GL_UNSIGNED_BYTE, texture_data)
+    # Mipmaps keep minified sampling cheap when the star contracts on screen
+    glGenerateMipmap(GL_TEXTURE_2D)
 
-    glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MIN_FILTER, GL_LINEAR)
+    glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MIN_FILTER, GL_LINEAR_MIPMAP_LINEAR)
     glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MAG_FILTER, GL_LINEAR)
     glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_WRAP_S, GL_REPEAT)
     glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_WRAP_T, GL_REPEAT)
 
     return texture_id
 
-def draw_sphere(radius, color, emission, texture_id):
-    glEnable(GL_TEXTURE_2D)
-    glBindTexture(GL_TEXTURE_2D, texture_id)
-
-    ambient = [x * 0.1 for x in color]
-    diffuse = [x * 0.3 for x in color]
-    emission_color = [x * emission for x in color]
-
-    glMaterialfv(GL_FRONT, GL_AMBIENT, [*ambient, 1.0])
-    glMaterialfv(GL_FRONT, GL_DIFFUSE, [*diffuse, 1.0])
-    glMaterialfv(GL_FRONT, GL_SPECULAR, [0.2, 0.2, 0.2, 1.0])
-    glMaterialfv(GL_FRONT, GL_EMISSION, [*emission_color, 1.0])
-    glMaterialf(GL_FRONT, GL_SHININESS, 10.0)
-
+def build_sphere_display_list():
+    """Tessellate a unit sphere once into a display list; scaled per frame"""
+    sphere_dl = glGenLists(1)
+    glNewList(sphere_dl, GL_COMPILE)
     quad = gluNewQuadric()
     gluQuadricTexture(quad, GL_TRUE)
     gluQuadricNormals(quad, GLU_SMOOTH)
-    gluSphere(quad, radius, 64, 64)
+    gluSphere(quad, 1.0, 64, 64)
     gluDeleteQuadric(quad)
+    glEndList()
+    return sphere_dl
+
+# Reusable material parameter buffers for draw_sphere (alpha stays 1.0);
+# avoids rebuilding Python lists and converting them to ctypes every frame
+_MAT_AMBIENT = np.array([0.0, 0.0, 0.0, 1.0], dtype=np.float32)
+_MAT_DIFFUSE = np.array([0.0, 0.0, 0.0, 1.0], dtype=np.float32)
+_MAT_EMISSION = np.array([0.0, 0.0, 0.0, 1.0], dtype=np.float32)
+_MAT_SPECULAR = np.array([0.2, 0.2, 0.2, 1.0], dtype=np.float32)
+
+def draw_sphere(radius, color, emission, texture_id, sphere_dl):
+    glBindTexture(GL_TEXTURE_2D, texture_id)
 
-    glDisable(GL_TEXTURE_2D)
+    _MAT_AMBIENT[:3] = color
+    _MAT_AMBIENT[:3] *= 0.1
+    _MAT_DIFFUSE[:3] = color
+    _MAT_DIFFUSE[:3] *= 0.3
+    _MAT_EMISSION[:3] = color
+    _MAT_EMISSION[:3] *= emission
+
+    glMaterialfv(GL_FRONT, GL_AMBIENT, _MAT_AMBIENT)
+    glMaterialfv(GL_FRONT, GL_DIFFUSE, _MAT_DIFFUSE)
+    glMaterialfv(GL_FRONT, GL_SPECULAR, _MAT_SPECULAR)
+    glMaterialfv(GL_FRONT, GL_EMISSION, _MAT_EMISSION)
+    glMaterialf(GL_FRONT, GL_SHININESS, 10.0)
+
+    glPushMatrix()
+    glScalef(radius, radius, radius)
+    glCallList(sphere_dl)
+    glPopMatrix()
+
+# Band of the screen that can hold the info text; the width actually
+# cleared and re-uploaded each update is measured from the rendered lines
+TEXT_RECT = pygame.Rect(0, 0, 800, 230)
+
+def create_text_texture(width, height):
+    """Allocate a persistent texture for the 2D text overlay"""
+    text_tex_id = glGenTextures(1)
+    glBindTexture(GL_TEXTURE_2D, text_tex_id)
+    # Start fully transparent since later updates only touch TEXT_RECT
+    blank = np.zeros((height, width, 4), dtype=np.uint8)
+    glTexImage2D(GL_TEXTURE_2D, 0, GL_RGBA, width, height, 0, GL_RGBA, GL_UNSIGNED_BYTE, blank)
+    glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MIN_FILTER, GL_LINEAR)
+    glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MAG_FILTER, GL_LINEAR)
+    return text_tex_id
+
+def get_display_info(star):
+    """Star stats quantized to the precision shown on screen"""
+    return (star.stage,
+            round(star.current_mass, 2),
+            round(star.temperature),
+            round(star.luminosity, 2),
+            round(star.radius, 2),
+            round(star.current_h2, 1),
+            round(star.age))
+
+# Font and rendered-line cache for the text overlay (font is created lazily
+# because pygame.font is only available after pygame.init())
+_font = None
+_line_cache = {}
+_LINE_CACHE_MAX = 50
+
+def _render_line(line):
+    """Render a line of text, reusing the cached surface when unchanged"""
+    surface = _line_cache.get(line)
+    if surface is None:
+        if len(_line_cache) >= _LINE_CACHE_MAX:
+            _line_cache.clear()
+        surface = _font.render(line, True, (255, 255, 255))
+        _line_cache[line] = surface
+    return surface
 
 def render_text(screen, star):
-    text_surface = pygame.Surface((800, 600), pygame.SRCALPHA)
-    font = pygame.font.Font(None, 36)
-    
+    """Draw the info lines onto the persistent overlay surface.
+
+    The caller clears the previous text region beforehand. Returns the
+    width in pixels actually covered by the rendered lines.
+    """
+    global _font
+    if _font is None:
+        _font = pygame.font.Font(None, 36)
+
     # Star information
     info_lines = [
-        f"Stage: {star.stage}",
+        f"Stage: {_STAGE_NAMES[star.stage]}",
         f"Mass: {star.current_mass:.2f} solar masses",
         f"Temperature: {star.temperature:.0f} K",
         f"Luminosity: {star.luminosity:.2f} solar luminosity",
@@ -281,13 +386,12 @@ def render_text(screen, star):
         f"Age: {star.age:.0f} years"
     ]
     
+    max_width = 0
     for i, line in enumerate(info_lines):
-        text_surface.blit(
-            font.render(line, True, (255, 255, 255)),
-            (10, 10 + i * 30)
-        )
-    
-    screen.blit(text_surface, (0, 0))
+        line_surface = _render_line(line)
+        screen.blit(line_surface, (10, 10 + i * 30))
+        max_width = max(max_width, line_surface.get_width())
+    return min(10 + max_width, screen.get_width())
 
 def main():
     # Get initial star parameters from user
@@ -307,14 +411,27 @@ def main():
     glEnable(GL_DEPTH_TEST)
     glEnable(GL_LIGHTING)
     glEnable(GL_LIGHT0)
+    # The sphere display list is replayed under glScalef, which scales the
+    # normals too; renormalize so lighting doesn't vary with visual radius
+    glEnable(GL_NORMALIZE)
+    # Texturing and the blend function never change; set them once here so
+    # the render loop only toggles depth/lighting/blend once per pass
+    glEnable(GL_TEXTURE_2D)
+    glBlendFunc(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA)
     glLightfv(GL_LIGHT0, GL_POSITION, [0.0, 0.0, 2.0, 1.0])
     glLightfv(GL_LIGHT0, GL_DIFFUSE, [0.3, 0.3, 0.3, 1.0])
     glLightModelfv(GL_LIGHT_MODEL_AMBIENT, [0.05, 0.05, 0.05, 1.0])
 
     clock = pygame.time.Clock()
     texture_id = load_texture()
+    sphere_dl = build_sphere_display_list()
+    text_tex_id = create_text_texture(width, height)
+    last_info = None
+    last_stage = None
+    text_width = TEXT_RECT.width
     star = StarPhysics(mass, h2_percentage)
     angle = 0
+    frame_count = 0
     
     time_acceleration = 1e3  # Simulation speed multiplier
 
@@ -341,11 +458,11 @@ def main():
         glRotatef(angle, 0, 1, 0)
         
         # Get star properties for visualization
-        visual_radius = np.log1p(star.radius) * 0.8  # Logarithmic scale for better visualization
+        visual_radius = math.log1p(star.radius) * 0.8  # Logarithmic scale for better visualization
         color = star.get_color()
         emission = star.get_emission()
         
-        draw_sphere(visual_radius, color, emission, texture_id)
+        draw_sphere(visual_radius, color, emission, texture_id, sphere_dl)
         glPopMatrix()
 
         # Switch to 2D mode for text
@@ -361,15 +478,40 @@ def main():
         glDisable(GL_DEPTH_TEST)
         glDisable(GL_LIGHTING)
         
-        # Render text
-        pygame_surface.fill((0, 0, 0, 0))
-        render_text(pygame_surface, star)
-        
-        # Convert Pygame surface to OpenGL texture
-        text_data = pygame.image.tostring(pygame_surface, 'RGBA', True)
+        # Re-render text at most every few frames (immediately on stage change)
+        # and only when the displayed stats actually change
+        if frame_count % 6 == 0 or star.stage != last_stage:
+            info = get_display_info(star)
+            if info != last_info:
+                last_info = info
+                last_stage = star.stage
+                pygame_surface.fill((0, 0, 0, 0),
+                                    (0, 0, text_width, TEXT_RECT.height))
+                new_width = render_text(pygame_surface, star)
+                # Upload the union of the old and new text widths so
+                # shrinking lines don't leave stale pixels on the texture
+                # (flipped rows land at the top of the texture, which the
+                # quad maps to the top of the screen)
+                upload_rect = pygame.Rect(0, 0, max(text_width, new_width),
+                                          TEXT_RECT.height)
+                text_width = new_width
+                text_data = pygame.image.tostring(
+                    pygame_surface.subsurface(upload_rect), 'RGBA', True)
+                glBindTexture(GL_TEXTURE_2D, text_tex_id)
+                glTexSubImage2D(GL_TEXTURE_2D, 0, 0, height - upload_rect.height,
+                                upload_rect.width, upload_rect.height,
+                                GL_RGBA, GL_UNSIGNED_BYTE, text_data)
+
+        # Draw the overlay as a textured quad
         glEnable(GL_BLEND)
-        glBlendFunc(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA)
-        glDrawPixels(width, height, GL_RGBA, GL_UNSIGNED_BYTE, text_data)
+        glBindTexture(GL_TEXTURE_2D, text_tex_id)
+        glColor4f(1.0, 1.0, 1.0, 1.0)
+        glBegin(GL_QUADS)
+        glTexCoord2f(0, 1); glVertex2f(0, 0)
+        glTexCoord2f(1, 1); glVertex2f(width, 0)
+        glTexCoord2f(1, 0); glVertex2f(width, height)
+        glTexCoord2f(0, 0); glVertex2f(0, height)
+        glEnd()
         glDisable(GL_BLEND)
 
         # Restore 3D mode
@@ -383,6 +525,7 @@ def main():
         pygame.display.flip()
         clock.tick(60)
         angle += 1
+        frame_count += 1
 
 if __name__ == "__main__":
     main()
\ No newline at end of file